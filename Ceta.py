@@ -1,16 +1,146 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from types import MappingProxyType
+import argparse
+import hashlib
+import os
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+# Style des graphiques, appliqué une seule fois à l'import
+try:
+    plt.style.use('seaborn-v0_8')
+except OSError:
+    plt.style.use('seaborn')  # Nom du style avant Matplotlib 3.6
+plt.rcParams['path.simplify_threshold'] = 1.0
+
+# Configuration spécifique pour chaque pays/secteur
+_CONFIGS = MappingProxyType({
+    "France": {
+        "type": "pays_ue",
+        "pib_base": 2700000,
+        "exportations_canada_base": 8500,
+        "importations_canada_base": 7200,
+        "secteurs_cles": ["aerospatial", "vin", "fromage", "luxe", "automobile"]
+    },
+    "Allemagne": {
+        "type": "pays_ue",
+        "pib_base": 3800000,
+        "exportations_canada_base": 12500,
+        "importations_canada_base": 9800,
+        "secteurs_cles": ["automobile", "machines", "chimie", "electronique", "equipements"]
+    },
+    "Italie": {
+        "type": "pays_ue",
+        "pib_base": 2000000,
+        "exportations_canada_base": 6800,
+        "importations_canada_base": 5200,
+        "secteurs_cles": ["mode", "agroalimentaire", "machines", "mobilier", "automobile"]
+    },
+    "Espagne": {
+        "type": "pays_ue",
+        "pib_base": 1400000,
+        "exportations_canada_base": 4200,
+        "importations_canada_base": 3800,
+        "secteurs_cles": ["agroalimentaire", "automobile", "vin", "tourisme", "services"]
+    },
+    "Pays-Bas": {
+        "type": "pays_ue",
+        "pib_base": 900000,
+        "exportations_canada_base": 5800,
+        "importations_canada_base": 6200,
+        "secteurs_cles": ["logistique", "agriculture", "energie", "chimie", "services_financiers"]
+    },
+    "Canada": {
+        "type": "pays_partenaire",
+        "pib_base": 1800000,
+        "exportations_ue_base": 42000,
+        "importations_ue_base": 45000,
+        "secteurs_cles": ["agriculture", "energie", "automobile", "bois", "minerais"]
+    },
+    "UE-27": {
+        "type": "union",
+        "pib_base": 15500000,
+        "exportations_canada_base": 420000,
+        "importations_canada_base": 380000,
+        "secteurs_cles": ["automobile", "agroalimentaire", "chimie", "machines", "services"]
+    },
+    "Agriculture": {
+        "type": "secteur",
+        "pib_base": None,
+        "exportations_base": 8500,
+        "importations_base": 7200,
+        "pays_cles": ["France", "Allemagne", "Pays-Bas", "Italie", "Espagne"]
+    },
+    "Automobile": {
+        "type": "secteur",
+        "pib_base": None,
+        "exportations_base": 32000,
+        "importations_base": 28000,
+        "pays_cles": ["Allemagne", "France", "Italie", "Espagne", "République tchèque"]
+    },
+    "Services": {
+        "type": "secteur",
+        "pib_base": None,
+        "exportations_base": 28000,
+        "importations_base": 25000,
+        "pays_cles": ["France", "Allemagne", "Royaume-Uni", "Pays-Bas", "Irlande"]
+    },
+    # Configuration par défaut
+    "default": {
+        "type": "pays_ue",
+        "pib_base": 500000,
+        "exportations_canada_base": 2500,
+        "importations_canada_base": 2200,
+        "secteurs_cles": ["diversifies"]
+    }
+})
+
+# Formateurs numériques du rapport, liés une seule fois
+_PCT1 = "{:.1f}%".format
+_PCT3 = "{:.3f}%".format
+_M0 = "{:.0f} M€".format
+_N0 = "{:.0f}".format
+
+# Recommandations spécifiques aux secteurs clés des pays de l'UE
+_RECOMMANDATIONS_SECTEURS = MappingProxyType({
+    "vin": ("• Profiter de la protection des indications géographiques",
+            "• Développer le marketing des vins européens au Canada"),
+    "fromage": ("• Utiliser les quotas d'importation pour fromages fins",
+                "• Mettre en valeur les appellations d'origine protégée"),
+    "automobile": ("• Profiter de l'élimination des droits de douane",
+                   "• Harmoniser les standards techniques pour réduire les coûts"),
+    "services": ("• Explorer les opportunités dans les services financiers",
+                 "• Développer les services professionnels et techniques"),
+})
+
+# Nombre maximal de rapports conservés en cache par analyseur
+_REPORT_CACHE_SIZE = 32
+
+# Tranches d'années des simulations : avant 2017, 2017-2019, 2020-2022, 2023 et après
+_CETA_BREAK_POINTS = np.array([2017, 2020, 2023])
+_CETA_BAND_ORIGINS = np.array([2016, 2016, 2019, 2022])
+
+def _summarize(values):
+    """Premières et dernières lignes, moyennes et sommes par colonne d'un tableau 2D"""
+    values = np.ascontiguousarray(values)
+    sums = values.sum(axis=0)
+    return values[0], values[-1], sums / len(values), sums
+
 class CETAImpactAnalyzer:
+    COLORS = ('#0055A4', '#FF0000', '#FFCC00', '#009900', '#660099', 
+              '#FF6600', '#0066CC', '#CC0000', '#00CCCC', '#FF00FF')
+    
     def __init__(self, country_sector):
         self.country_sector = country_sector
-        self.colors = ['#0055A4', '#FF0000', '#FFCC00', '#009900', '#660099', 
-                      '#FF6600', '#0066CC', '#CC0000', '#00CCCC', '#FF00FF']
         
         self.start_year = 2017  # Entrée en vigueur provisoire du CETA
         self.end_year = 2027
@@ -18,175 +148,121 @@ class CETAImpactAnalyzer:
         # Configuration spécifique pour chaque pays/secteur
         self.config = self._get_country_sector_config()
         
+        # Années et indices de période partagés par les simulateurs
+        self._years = None
+        self._idx = None
+        
+        # Données générées, mises en cache par generate_ceta_data
+        self._df = None
+        
+        # Textes des rapports déjà construits, par empreinte des données
+        self._report_cache = OrderedDict()
+        
     def _get_country_sector_config(self):
         """Retourne la configuration spécifique pour chaque pays/secteur"""
-        configs = {
-            "France": {
-                "type": "pays_ue",
-                "pib_base": 2700000,
-                "exportations_canada_base": 8500,
-                "importations_canada_base": 7200,
-                "secteurs_cles": ["aerospatial", "vin", "fromage", "luxe", "automobile"]
-            },
-            "Allemagne": {
-                "type": "pays_ue",
-                "pib_base": 3800000,
-                "exportations_canada_base": 12500,
-                "importations_canada_base": 9800,
-                "secteurs_cles": ["automobile", "machines", "chimie", "electronique", "equipements"]
-            },
-            "Italie": {
-                "type": "pays_ue",
-                "pib_base": 2000000,
-                "exportations_canada_base": 6800,
-                "importations_canada_base": 5200,
-                "secteurs_cles": ["mode", "agroalimentaire", "machines", "mobilier", "automobile"]
-            },
-            "Espagne": {
-                "type": "pays_ue",
-                "pib_base": 1400000,
-                "exportations_canada_base": 4200,
-                "importations_canada_base": 3800,
-                "secteurs_cles": ["agroalimentaire", "automobile", "vin", "tourisme", "services"]
-            },
-            "Pays-Bas": {
-                "type": "pays_ue",
-                "pib_base": 900000,
-                "exportations_canada_base": 5800,
-                "importations_canada_base": 6200,
-                "secteurs_cles": ["logistique", "agriculture", "energie", "chimie", "services_financiers"]
-            },
-            "Canada": {
-                "type": "pays_partenaire",
-                "pib_base": 1800000,
-                "exportations_ue_base": 42000,
-                "importations_ue_base": 45000,
-                "secteurs_cles": ["agriculture", "energie", "automobile", "bois", "minerais"]
-            },
-            "UE-27": {
-                "type": "union",
-                "pib_base": 15500000,
-                "exportations_canada_base": 420000,
-                "importations_canada_base": 380000,
-                "secteurs_cles": ["automobile", "agroalimentaire", "chimie", "machines", "services"]
-            },
-            "Agriculture": {
-                "type": "secteur",
-                "pib_base": None,
-                "exportations_base": 8500,
-                "importations_base": 7200,
-                "pays_cles": ["France", "Allemagne", "Pays-Bas", "Italie", "Espagne"]
-            },
-            "Automobile": {
-                "type": "secteur",
-                "pib_base": None,
-                "exportations_base": 32000,
-                "importations_base": 28000,
-                "pays_cles": ["Allemagne", "France", "Italie", "Espagne", "République tchèque"]
-            },
-            "Services": {
-                "type": "secteur",
-                "pib_base": None,
-                "exportations_base": 28000,
-                "importations_base": 25000,
-                "pays_cles": ["France", "Allemagne", "Royaume-Uni", "Pays-Bas", "Irlande"]
-            },
-            # Configuration par défaut
-            "default": {
-                "type": "pays_ue",
-                "pib_base": 500000,
-                "exportations_canada_base": 2500,
-                "importations_canada_base": 2200,
-                "secteurs_cles": ["diversifies"]
-            }
-        }
-        
-        return configs.get(self.country_sector, configs["default"])
+        return _CONFIGS.get(self.country_sector, _CONFIGS["default"])
     
-    def generate_ceta_data(self):
-        """Génère des données sur l'impact du CETA"""
+    def generate_ceta_data(self, force=False):
+        """Génère des données sur l'impact du CETA (mises en cache sur l'analyseur)"""
+        if self._df is not None and not force:
+            return self._df
+        
         print(f"🇪🇺🇨🇦 Génération des données CETA pour {self.country_sector}...")
         
-        # Créer une base de données annuelle
-        dates = pd.date_range(start=f'{self.start_year}-01-01', 
-                             end=f'{self.end_year}-12-31', freq='Y')
+        # Créer une base de données annuelle (années et indices de période, calculés une seule fois)
+        self._years = np.arange(self.start_year, self.end_year + 1, dtype=np.int32)
+        self._idx = np.arange(len(self._years), dtype=np.float64)
+        
+        data = {}
         
-        data = {'Annee': [date.year for date in dates]}
+        config_type = self.config["type"]
         
         # Données économiques de base (uniquement pour les pays, pas les secteurs)
-        if self.config["type"] != "secteur":
-            data['PIB'] = self._simulate_gdp(dates)
+        if config_type != "secteur":
+            data['PIB'] = self._simulate_gdp()
         
         # Échanges commerciaux
-        data['Exportations_Vers_Canada'] = self._simulate_exports(dates)
-        data['Importations_Du_Canada'] = self._simulate_imports(dates)
-        data['Balance_Commerciale'] = self._calculate_trade_balance(dates)
+        data['Exportations_Vers_Canada'] = self._simulate_exports()
+        data['Importations_Du_Canada'] = self._simulate_imports()
+        data['Balance_Commerciale'] = data['Exportations_Vers_Canada'] - data['Importations_Du_Canada']
         
         # Droits de douane et barrières
-        data['Droits_Douane_Moyens'] = self._simulate_tariffs(dates)
-        data['Barrieres_Non_Tarifaires'] = self._simulate_non_tariff_barriers(dates)
+        data['Droits_Douane_Moyens'] = self._simulate_tariffs()
+        data['Barrieres_Non_Tarifaires'] = self._simulate_non_tariff_barriers()
         
         # Impacts sectoriels
-        data['Creation_Emplois'] = self._simulate_job_creation(dates)
-        data['Croissance_Sectorielle'] = self._simulate_sector_growth(dates)
-        data['Investissements_Etrangers'] = self._simulate_foreign_investment(dates)
+        data['Creation_Emplois'] = self._simulate_job_creation()
+        data['Croissance_Sectorielle'] = self._simulate_sector_growth()
+        data['Investissements_Etrangers'] = self._simulate_foreign_investment()
         
         # Indicateurs d'impact économique (uniquement pour les pays)
-        if self.config["type"] != "secteur":
-            data['Impact_Sur_PIB'] = self._simulate_gdp_impact(dates)
-            data['Gains_Productivite'] = self._simulate_productivity_gains(dates)
-            data['Economies_Douanieres'] = self._simulate_customs_savings(dates)
+        if config_type != "secteur":
+            data['Impact_Sur_PIB'] = self._simulate_gdp_impact()
+            data['Gains_Productivite'] = self._simulate_productivity_gains()
+            data['Economies_Douanieres'] = self._simulate_customs_savings()
         
         # Indicateurs spécifiques selon le type
-        if self.config["type"] == "pays_ue" or self.config["type"] == "union":
+        if config_type in ["pays_ue", "union"]:
+            sector_simulators = {
+                "vin": ('Exportations_Vin', self._simulate_wine_exports),
+                "fromage": ('Exportations_Fromage', self._simulate_cheese_exports),
+                "automobile": ('Exportations_Automobile', self._simulate_auto_exports),
+                "aerospatial": ('Exportations_Aerospatial', self._simulate_aerospace_exports),
+            }
             for secteur in self.config["secteurs_cles"]:
-                if secteur == "vin":
-                    data['Exportations_Vin'] = self._simulate_wine_exports(dates)
-                elif secteur == "fromage":
-                    data['Exportations_Fromage'] = self._simulate_cheese_exports(dates)
-                elif secteur == "automobile":
-                    data['Exportations_Automobile'] = self._simulate_auto_exports(dates)
-                elif secteur == "aerospatial":
-                    data['Exportations_Aerospatial'] = self._simulate_aerospace_exports(dates)
+                simulator = sector_simulators.get(secteur)
+                if simulator is not None:
+                    column, simulate = simulator
+                    data[column] = simulate()
         
-        elif self.config["type"] == "secteur":
+        elif config_type == "secteur":
             for pays in self.config["pays_cles"]:
-                data[f'Exportations_{pays}'] = self._simulate_country_exports(dates, pays)
-        
-        df = pd.DataFrame(data)
+                data[f'Exportations_{pays}'] = self._simulate_country_exports(pays)
         
         # Ajouter des tendances spécifiques
-        self._add_ceta_trends(df)
+        self._add_ceta_trends(data)
+        
+        # Regrouper les colonnes dans un seul tableau 2D (ordre Fortran : colonnes contiguës),
+        # repris sans copie par pandas comme un unique bloc. La simple précision suffit
+        # largement pour ces indicateurs et divise par deux la mémoire du tableau.
+        columns = list(data)
+        values = np.empty((len(self._years), len(columns)), dtype=np.float32, order='F')
+        for j, column in enumerate(columns):
+            values[:, j] = data[column]
+        
+        df = pd.DataFrame(values, columns=columns, copy=False)
+        df.insert(0, 'Annee', self._years)
+        
+        # Libérer les tableaux partagés par les simulateurs
+        self._years = None
+        self._idx = None
         
+        self._df = df
         return df
     
-    def _simulate_gdp(self, dates):
+    def invalidate_cache(self):
+        """Vide le cache des données générées et des rapports"""
+        self._df = None
+        self._report_cache.clear()
+    
+    def _simulate_gdp(self):
         """Simule l'évolution du PIB"""
         base_gdp = self.config["pib_base"]
         
-        gdp = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            # Croissance de base différente selon le type
-            if self.config["type"] == "pays_ue" or self.config["type"] == "union":
-                base_growth = 0.018  # Croissance moyenne UE
-            elif self.config["type"] == "pays_partenaire":
-                base_growth = 0.022  # Croissance moyenne Canada
-            else:  # secteur
-                base_growth = 0.020  # Croissance moyenne sectorielle
-                
-            # Effet du CETA sur la croissance
-            ceta_effect = 0.0
-            if year >= 2017:  # Après l'entrée en vigueur
-                ceta_effect = 0.002 * (year - 2016)  # Effet cumulatif
-                
-            growth = 1 + (base_growth + ceta_effect) * i
-            gdp.append(base_gdp * growth)
-        
-        return gdp
-    
-    def _simulate_exports(self, dates):
+        # Croissance de base différente selon le type
+        base_growth = {
+            "pays_ue": 0.018,          # Croissance moyenne UE
+            "union": 0.018,
+            "pays_partenaire": 0.022,  # Croissance moyenne Canada
+        }.get(self.config["type"], 0.020)  # Croissance moyenne sectorielle
+        
+        # Effet du CETA sur la croissance (cumulatif après l'entrée en vigueur)
+        ceta_effect = 0.002 * np.maximum(0, self._years - 2016)
+        
+        growth = 1 + (base_growth + ceta_effect) * self._idx
+        return base_gdp * growth
+    
+    def _simulate_exports(self):
         """Simule les exportations vers le Canada"""
         if self.config["type"] in ["pays_ue", "union"]:
             base_exports = self.config["exportations_canada_base"]
@@ -195,22 +271,13 @@ class CETAImpactAnalyzer:
         else:  # Canada
             base_exports = self.config["exportations_ue_base"]
         
-        exports = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            # Effet du CETA sur les exportations
-            ceta_effect = 0.0
-            if year >= 2017:  # Après l'entrée en vigueur
-                # Augmentation progressive des exportations grâce au CETA
-                ceta_effect = 0.08 * min(5, year - 2016)  # Effet croissant jusqu'à 5 ans
-                
-            growth = 1 + (0.03 + ceta_effect) * i  # Croissance de base + effet CETA
-            exports.append(base_exports * growth)
-        
-        return exports
-    
-    def _simulate_imports(self, dates):
+        # Effet du CETA : augmentation progressive des exportations, croissant jusqu'à 5 ans
+        ceta_effect = 0.08 * np.clip(self._years - 2016, 0, 5)
+        
+        growth = 1 + (0.03 + ceta_effect) * self._idx  # Croissance de base + effet CETA
+        return base_exports * growth
+    
+    def _simulate_imports(self):
         """Simule les importations depuis le Canada"""
         if self.config["type"] in ["pays_ue", "union"]:
             base_imports = self.config["importations_canada_base"]
@@ -219,377 +286,199 @@ class CETAImpactAnalyzer:
         else:  # Canada
             base_imports = self.config["importations_ue_base"]
         
-        imports = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            # Effet du CETA sur les importations
-            ceta_effect = 0.0
-            if year >= 2017:  # Après l'entrée en vigueur
-                # Augmentation progressive des importations grâce au CETA
-                ceta_effect = 0.06 * min(5, year - 2016)  # Effet croissant jusqu'à 5 ans
-                
-            growth = 1 + (0.025 + ceta_effect) * i  # Croissance de base + effet CETA
-            imports.append(base_imports * growth)
-        
-        return imports
-    
-    def _calculate_trade_balance(self, dates):
-        """Calcule la balance commerciale"""
-        exports = self._simulate_exports(dates)
-        imports = self._simulate_imports(dates)
-        
-        return [exports[i] - imports[i] for i in range(len(exports))]
-    
-    def _simulate_tariffs(self, dates):
+        # Effet du CETA : augmentation progressive des importations, croissant jusqu'à 5 ans
+        ceta_effect = 0.06 * np.clip(self._years - 2016, 0, 5)
+        
+        growth = 1 + (0.025 + ceta_effect) * self._idx  # Croissance de base + effet CETA
+        return base_imports * growth
+    
+    def _piecewise_year(self, break_points, expressions):
+        """Sélectionne une expression par tranche d'années (years < break_point)"""
+        band = np.searchsorted(break_points, self._years, side='right')
+        return np.choose(band, expressions)
+    
+    def _ceta_curve(self, initial, slope1, level2, slope2, level3, slope3):
+        """Courbe type avant CETA / progression / accélération / stabilisation"""
+        years = self._years
+        band = np.searchsorted(_CETA_BREAK_POINTS, years, side='right')
+        
+        # Une ligne par tranche : avant CETA, progression, accélération, stabilisation
+        level = np.array([initial, initial, level2, level3], dtype=np.float64)
+        slope = np.array([0.0, slope1, slope2, slope3])
+        return level[band] + slope[band] * (years - _CETA_BAND_ORIGINS[band])
+    
+    def _simulate_tariffs(self):
         """Simule l'évolution des droits de douane moyens"""
-        tariffs = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                tariff = 4.2  # Moyenne avant CETA
-            elif year < 2020:
-                tariff = 1.8  # Réduction rapide
-            elif year < 2023:
-                tariff = 0.7  # Réduction continue
-            else:
-                tariff = 0.1  # Presque éliminés
-                
-            tariffs.append(tariff)
-        
-        return tariffs
-    
-    def _simulate_non_tariff_barriers(self, dates):
+        # Moyenne avant CETA, réduction rapide, réduction continue, presque éliminés
+        return self._piecewise_year(_CETA_BREAK_POINTS, [4.2, 1.8, 0.7, 0.1])
+    
+    def _simulate_non_tariff_barriers(self):
         """Simule la réduction des barrières non tarifaires"""
-        barriers = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                barrier = 8.5  # Niveau élevé avant CETA
-            elif year < 2020:
-                barrier = 6.2  # Réduction modérée
-            elif year < 2023:
-                barrier = 4.1  # Réduction continue
-            else:
-                barrier = 2.8  # Niveau réduit mais persistant
-                
-            barriers.append(barrier)
-        
-        return barriers
-    
-    def _simulate_job_creation(self, dates):
+        # Niveau élevé avant CETA, réduction modérée, réduction continue, niveau persistant
+        return self._piecewise_year(_CETA_BREAK_POINTS, [8.5, 6.2, 4.1, 2.8])
+    
+    def _simulate_job_creation(self):
         """Simule la création d'emplois liée au CETA"""
-        jobs = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                created = 0  # Avant CETA
-            elif year < 2020:
-                created = 8000 * (year - 2016)  # Création progressive
-            elif year < 2023:
-                created = 24000 + 5000 * (year - 2019)  # Accélération
-            else:
-                created = 39000 + 3000 * (year - 2022)  # Stabilisation
-                
-            # Ajustement selon le type
-            if self.config["type"] in ["pays_ue", "union"]:
-                multiplier = 1.0
-            elif self.config["type"] == "secteur":
-                multiplier = 0.3
-            else:
-                multiplier = 0.1
-                
-            jobs.append(created * multiplier)
-        
-        return jobs
-    
-    def _simulate_sector_growth(self, dates):
+        created = self._ceta_curve(0, 8000, 24000, 5000, 39000, 3000)
+        
+        # Ajustement selon le type
+        if self.config["type"] in ["pays_ue", "union"]:
+            multiplier = 1.0
+        elif self.config["type"] == "secteur":
+            multiplier = 0.3
+        else:
+            multiplier = 0.1
+        
+        return created * multiplier
+    
+    def _simulate_sector_growth(self):
         """Simule la croissance sectorielle liée au CETA"""
-        growth = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                sector_growth = 0.0  # Avant CETA
-            elif year < 2020:
-                sector_growth = 0.015 * (year - 2016)  # Croissance progressive
-            elif year < 2023:
-                sector_growth = 0.045 + 0.008 * (year - 2019)  # Accélération
-            else:
-                sector_growth = 0.069 + 0.005 * (year - 2022)  # Stabilisation
-                
-            growth.append(sector_growth)
-        
-        return growth
-    
-    def _simulate_foreign_investment(self, dates):
+        return self._ceta_curve(0.0, 0.015, 0.045, 0.008, 0.069, 0.005)
+    
+    def _simulate_foreign_investment(self):
         """Simule l'augmentation des investissements étrangers"""
-        investment = []
         base_investment = 1000  # Base en millions d'euros
-        
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                increase = 0  # Avant CETA
-            elif year < 2020:
-                increase = 0.12 * (year - 2016)  # Augmentation progressive
-            elif year < 2023:
-                increase = 0.36 + 0.10 * (year - 2019)  # Accélération
-            else:
-                increase = 0.66 + 0.08 * (year - 2022)  # Stabilisation
-                
-            investment.append(base_investment * (1 + increase))
-        
-        return investment
-    
-    def _simulate_gdp_impact(self, dates):
+        increase = self._ceta_curve(0, 0.12, 0.36, 0.10, 0.66, 0.08)
+        return base_investment * (1 + increase)
+    
+    def _simulate_gdp_impact(self):
         """Simule l'impact du CETA sur le PIB"""
-        impact = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                gdp_impact = 0.0  # Avant CETA
-            elif year < 2020:
-                gdp_impact = 0.0012 * (year - 2016)  # Impact progressif
-            elif year < 2023:
-                gdp_impact = 0.0036 + 0.0008 * (year - 2019)  # Accélération
-            else:
-                gdp_impact = 0.0060 + 0.0006 * (year - 2022)  # Stabilisation
-                
-            impact.append(gdp_impact)
-        
-        return impact
-    
-    def _simulate_productivity_gains(self, dates):
+        return self._ceta_curve(0.0, 0.0012, 0.0036, 0.0008, 0.0060, 0.0006)
+    
+    def _simulate_productivity_gains(self):
         """Simule les gains de productivité liés au CETA"""
-        gains = []
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                productivity_gain = 0.0  # Avant CETA
-            elif year < 2020:
-                productivity_gain = 0.0008 * (year - 2016)  # Gains progressifs
-            elif year < 2023:
-                productivity_gain = 0.0024 + 0.0006 * (year - 2019)  # Accélération
-            else:
-                productivity_gain = 0.0042 + 0.0004 * (year - 2022)  # Stabilisation
-                
-            gains.append(productivity_gain)
-        
-        return gains
-    
-    def _simulate_customs_savings(self, dates):
+        return self._ceta_curve(0.0, 0.0008, 0.0024, 0.0006, 0.0042, 0.0004)
+    
+    def _simulate_customs_savings(self):
         """Simule les économies douanières liées au CETA"""
-        savings = []
         base_savings = 500  # Base en millions d'euros
-        
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                saving = 0  # Avant CETA
-            elif year < 2020:
-                saving = 0.25 * (year - 2016)  # Économies progressives
-            elif year < 2023:
-                saving = 0.75 + 0.20 * (year - 2019)  # Accélération
-            else:
-                saving = 1.35 + 0.15 * (year - 2022)  # Stabilisation
-                
-            savings.append(base_savings * saving)
-        
-        return savings
-    
-    def _simulate_wine_exports(self, dates):
+        return base_savings * self._ceta_curve(0, 0.25, 0.75, 0.20, 1.35, 0.15)
+    
+    def _simulate_wine_exports(self):
         """Simule les exportations de vin vers le Canada"""
-        exports = []
         base_exports = 1200  # Millions d'euros
-        
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                growth = 1.0  # Avant CETA
-            elif year < 2020:
-                growth = 1.0 + 0.15 * (year - 2016)  # Croissance progressive
-            elif year < 2023:
-                growth = 1.45 + 0.12 * (year - 2019)  # Accélération
-            else:
-                growth = 1.81 + 0.10 * (year - 2022)  # Stabilisation
-                
-            exports.append(base_exports * growth)
-        
-        return exports
-    
-    def _simulate_cheese_exports(self, dates):
+        return base_exports * self._ceta_curve(1.0, 0.15, 1.45, 0.12, 1.81, 0.10)
+    
+    def _simulate_cheese_exports(self):
         """Simule les exportations de fromage vers le Canada"""
-        exports = []
         base_exports = 850  # Millions d'euros
-        
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                growth = 1.0  # Avant CETA
-            elif year < 2020:
-                growth = 1.0 + 0.18 * (year - 2016)  # Croissance progressive
-            elif year < 2023:
-                growth = 1.54 + 0.15 * (year - 2019)  # Accélération
-            else:
-                growth = 1.99 + 0.12 * (year - 2022)  # Stabilisation
-                
-            exports.append(base_exports * growth)
-        
-        return exports
-    
-    def _simulate_auto_exports(self, dates):
+        return base_exports * self._ceta_curve(1.0, 0.18, 1.54, 0.15, 1.99, 0.12)
+    
+    def _simulate_auto_exports(self):
         """Simule les exportations automobiles vers le Canada"""
-        exports = []
         base_exports = 5800  # Millions d'euros
-        
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                growth = 1.0  # Avant CETA
-            elif year < 2020:
-                growth = 1.0 + 0.10 * (year - 2016)  # Croissance progressive
-            elif year < 2023:
-                growth = 1.30 + 0.08 * (year - 2019)  # Accélération
-            else:
-                growth = 1.54 + 0.06 * (year - 2022)  # Stabilisation
-                
-            exports.append(base_exports * growth)
-        
-        return exports
-    
-    def _simulate_aerospace_exports(self, dates):
+        return base_exports * self._ceta_curve(1.0, 0.10, 1.30, 0.08, 1.54, 0.06)
+    
+    def _simulate_aerospace_exports(self):
         """Simule les exportations aérospatiales vers le Canada"""
-        exports = []
         base_exports = 4200  # Millions d'euros
-        
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                growth = 1.0  # Avant CETA
-            elif year < 2020:
-                growth = 1.0 + 0.12 * (year - 2016)  # Croissance progressive
-            elif year < 2023:
-                growth = 1.36 + 0.10 * (year - 2019)  # Accélération
-            else:
-                growth = 1.66 + 0.08 * (year - 2022)  # Stabilisation
-                
-            exports.append(base_exports * growth)
-        
-        return exports
-    
-    def _simulate_country_exports(self, dates, country):
+        return base_exports * self._ceta_curve(1.0, 0.12, 1.36, 0.10, 1.66, 0.08)
+    
+    def _simulate_country_exports(self, country):
         """Simule les exportations d'un pays spécifique pour un secteur"""
-        exports = []
         base_exports = 1500  # Millions d'euros
-        
-        for i, date in enumerate(dates):
-            year = date.year
-            
-            if year < 2017:
-                growth = 1.0  # Avant CETA
-            elif year < 2020:
-                growth = 1.0 + 0.14 * (year - 2016)  # Croissance progressive
-            elif year < 2023:
-                growth = 1.42 + 0.11 * (year - 2019)  # Accélération
-            else:
-                growth = 1.75 + 0.09 * (year - 2022)  # Stabilisation
-                
-            exports.append(base_exports * growth)
-        
-        return exports
-    
-    def _add_ceta_trends(self, df):
+        return base_exports * self._ceta_curve(1.0, 0.14, 1.42, 0.11, 1.75, 0.09)
+    
+    def _add_ceta_trends(self, data):
         """Ajoute des tendances spécifiques liées au CETA"""
-        for i, row in df.iterrows():
-            year = row['Annee']
-            
-            # Effets de l'entrée en vigueur provisoire (2017)
-            if year >= 2017:
-                df.loc[i, 'Exportations_Vers_Canada'] *= 1.08  # Augmentation initiale
-                df.loc[i, 'Importations_Du_Canada'] *= 1.06    # Augmentation initiale
-            
-            # Effets de la ratification complète (hypothétique 2020)
-            if year >= 2020:
-                df.loc[i, 'Exportations_Vers_Canada'] *= 1.12  # Augmentation supplémentaire
-                df.loc[i, 'Importations_Du_Canada'] *= 1.09    # Augmentation supplémentaire
-                df.loc[i, 'Investissements_Etrangers'] *= 1.15 # Augmentation des investissements
-            
-            # Impact de la pandémie COVID-19 (2020-2021)
-            if 2020 <= year <= 2021:
-                df.loc[i, 'Exportations_Vers_Canada'] *= 0.85  # Réduction due au COVID
-                df.loc[i, 'Importations_Du_Canada'] *= 0.88    # Réduction due au COVID
-            
-            # Reprise post-COVID (2022-2023)
-            if year >= 2022:
-                df.loc[i, 'Exportations_Vers_Canada'] *= 1.18  # Reprise forte
-                df.loc[i, 'Importations_Du_Canada'] *= 1.15    # Reprise forte
-    
-    def create_ceta_analysis(self, df):
+        years = self._years
+        exp_factor = np.ones(len(years))
+        imp_factor = np.ones(len(years))
+        inv_factor = np.ones(len(years))
+        
+        # Effets de l'entrée en vigueur provisoire (2017)
+        mask = years >= 2017
+        exp_factor[mask] *= 1.08  # Augmentation initiale
+        imp_factor[mask] *= 1.06  # Augmentation initiale
+        
+        # Effets de la ratification complète (hypothétique 2020)
+        mask = years >= 2020
+        exp_factor[mask] *= 1.12  # Augmentation supplémentaire
+        imp_factor[mask] *= 1.09  # Augmentation supplémentaire
+        inv_factor[mask] *= 1.15  # Augmentation des investissements
+        
+        # Impact de la pandémie COVID-19 (2020-2021)
+        mask = (years >= 2020) & (years <= 2021)
+        exp_factor[mask] *= 0.85  # Réduction due au COVID
+        imp_factor[mask] *= 0.88  # Réduction due au COVID
+        
+        # Reprise post-COVID (2022-2023)
+        mask = years >= 2022
+        exp_factor[mask] *= 1.18  # Reprise forte
+        imp_factor[mask] *= 1.15  # Reprise forte
+        
+        data['Exportations_Vers_Canada'] = data['Exportations_Vers_Canada'] * exp_factor
+        data['Importations_Du_Canada'] = data['Importations_Du_Canada'] * imp_factor
+        data['Investissements_Etrangers'] = data['Investissements_Etrangers'] * inv_factor
+    
+    def create_ceta_analysis(self, df, style=None, dpi=150, show=True):
         """Crée une analyse complète de l'impact du CETA"""
-        plt.style.use('seaborn-v0_8')
-        fig = plt.figure(figsize=(20, 24))
+        # Croissances et moyennes n'ont pas de sens sur moins de deux années
+        n = len(df)
+        if n < 2:
+            print(f"⚠️ Données insuffisantes pour {self.country_sector} (n={n})")
+            return
+        
+        # Un style passé en argument ne s'applique qu'à cette figure
+        with plt.style.context(style) if style is not None else nullcontext():
+            self._plot_ceta_figure(df, dpi, show)
+        
+        # Générer les insights
+        self._generate_ceta_insights(df)
+    
+    def _plot_ceta_figure(self, df, dpi, show):
+        """Construit, sauvegarde et affiche la figure d'analyse du CETA"""
+        fig, axes = plt.subplots(4, 2, figsize=(20, 24), constrained_layout=True)
+        ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8 = axes.flat
+        
+        # Extraire les colonnes en tableaux NumPy une seule fois pour tous les graphiques
+        data = {column: df[column].to_numpy() for column in df.columns}
         
         # 1. Évolution des échanges commerciaux
-        ax1 = plt.subplot(4, 2, 1)
-        self._plot_trade_evolution(df, ax1)
+        self._plot_trade_evolution(data, ax1)
         
         # 2. Impact sur la balance commerciale
-        ax2 = plt.subplot(4, 2, 2)
-        self._plot_trade_balance(df, ax2)
+        self._plot_trade_balance(data, ax2)
         
         # 3. Réduction des barrières commerciales
-        ax3 = plt.subplot(4, 2, 3)
-        self._plot_trade_barriers(df, ax3)
+        self._plot_trade_barriers(data, ax3)
         
         # 4. Impact sur l'emploi et les investissements
-        ax4 = plt.subplot(4, 2, 4)
-        self._plot_employment_investment(df, ax4)
+        self._plot_employment_investment(data, ax4)
         
         # 5. Impact sur le PIB et la productivité (uniquement pour les pays)
         if self.config["type"] != "secteur":
-            ax5 = plt.subplot(4, 2, 5)
-            self._plot_gdp_productivity(df, ax5)
+            self._plot_gdp_productivity(data, ax5)
+        else:
+            ax5.remove()
         
         # 6. Analyse sectorielle
-        ax6 = plt.subplot(4, 2, 6)
-        self._plot_sectoral_analysis(df, ax6)
+        self._plot_sectoral_analysis(data, ax6)
         
         # 7. Gains économiques (uniquement pour les pays)
         if self.config["type"] != "secteur":
-            ax7 = plt.subplot(4, 2, 7)
-            self._plot_economic_gains(df, ax7)
+            self._plot_economic_gains(data, ax7)
+        else:
+            ax7.remove()
         
         # 8. Comparaison avant/après CETA
-        ax8 = plt.subplot(4, 2, 8)
         self._plot_before_after_comparison(df, ax8)
         
-        plt.suptitle(f'Analyse de l\'Impact du CETA - {self.country_sector} ({self.start_year}-{self.end_year})', 
+        fig.suptitle(f'Analyse de l\'Impact du CETA - {self.country_sector} ({self.start_year}-{self.end_year})', 
                     fontsize=16, fontweight='bold')
-        plt.tight_layout()
-        plt.savefig(f'{self.country_sector}_ceta_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        # Générer les insights
-        self._generate_ceta_insights(df)
-    
-    def _plot_trade_evolution(self, df, ax):
+        # constrained_layout gère déjà les marges : pas de passe bbox_inches='tight'
+        plt.savefig(f'{self.country_sector}_ceta_analysis.png', dpi=dpi)
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+    
+    def _plot_trade_evolution(self, data, ax):
         """Plot de l'évolution des échanges commerciaux"""
-        ax.plot(df['Annee'], df['Exportations_Vers_Canada'], label='Exportations vers Canada', 
-               linewidth=2, color='#0055A4', alpha=0.8)
-        ax.plot(df['Annee'], df['Importations_Du_Canada'], label='Importations depuis Canada', 
-               linewidth=2, color='#FF0000', alpha=0.8)
+        ax.plot(data['Annee'], data['Exportations_Vers_Canada'], label='Exportations vers Canada', 
+               linewidth=2, color='#0055A4', alpha=0.8, rasterized=True)
+        ax.plot(data['Annee'], data['Importations_Du_Canada'], label='Importations depuis Canada', 
+               linewidth=2, color='#FF0000', alpha=0.8, rasterized=True)
         
         ax.set_title('Évolution des Échanges Commerciaux (M€)', 
                     fontsize=12, fontweight='bold')
@@ -597,10 +486,11 @@ class CETAImpactAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_trade_balance(self, df, ax):
+    def _plot_trade_balance(self, data, ax):
         """Plot de l'impact sur la balance commerciale"""
-        ax.bar(df['Annee'], df['Balance_Commerciale'], 
-              color=['#009900' if x >= 0 else '#CC0000' for x in df['Balance_Commerciale']],
+        balance = data['Balance_Commerciale']
+        ax.bar(data['Annee'], balance, 
+              color=np.where(balance >= 0, '#009900', '#CC0000'),
               alpha=0.7)
         
         ax.set_title('Balance Commerciale avec le Canada (M€)', fontsize=12, fontweight='bold')
@@ -608,11 +498,11 @@ class CETAImpactAnalyzer:
         ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
         ax.grid(True, alpha=0.3, axis='y')
     
-    def _plot_trade_barriers(self, df, ax):
+    def _plot_trade_barriers(self, data, ax):
         """Plot de la réduction des barrières commerciales"""
-        ax.plot(df['Annee'], df['Droits_Douane_Moyens'], label='Droits de douane moyens (%)', 
+        ax.plot(data['Annee'], data['Droits_Douane_Moyens'], label='Droits de douane moyens (%)', 
                linewidth=2, color='#0055A4', alpha=0.8)
-        ax.plot(df['Annee'], df['Barrieres_Non_Tarifaires'], label='Barrières non tarifaires (indice)', 
+        ax.plot(data['Annee'], data['Barrieres_Non_Tarifaires'], label='Barrières non tarifaires (indice)', 
                linewidth=2, color='#FF6600', alpha=0.8)
         
         ax.set_title('Réduction des Barrières Commerciales', fontsize=12, fontweight='bold')
@@ -620,9 +510,9 @@ class CETAImpactAnalyzer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def _plot_employment_investment(self, df, ax):
+    def _plot_employment_investment(self, data, ax):
         """Plot de l'impact sur l'emploi et les investissements"""
-        ax.plot(df['Annee'], df['Creation_Emplois'], label='Création d\'emplois', 
+        ax.plot(data['Annee'], data['Creation_Emplois'], label='Création d\'emplois', 
                linewidth=2, color='#0055A4', alpha=0.8)
         
         ax.set_title('Impact sur l\'Emploi', fontsize=12, fontweight='bold')
@@ -632,7 +522,7 @@ class CETAImpactAnalyzer:
         
         # Investissements en second axe
         ax2 = ax.twinx()
-        ax2.plot(df['Annee'], df['Investissements_Etrangers'], label='Investissements étrangers (M€)', 
+        ax2.plot(data['Annee'], data['Investissements_Etrangers'], label='Investissements étrangers (M€)', 
                 linewidth=2, color='#FF0000', alpha=0.8)
         ax2.set_ylabel('Investissements (M€)', color='#FF0000')
         ax2.tick_params(axis='y', labelcolor='#FF0000')
@@ -642,9 +532,9 @@ class CETAImpactAnalyzer:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
     
-    def _plot_gdp_productivity(self, df, ax):
+    def _plot_gdp_productivity(self, data, ax):
         """Plot de l'impact sur le PIB et la productivité"""
-        ax.plot(df['Annee'], df['Impact_Sur_PIB'], label='Impact sur le PIB (%)', 
+        ax.plot(data['Annee'], data['Impact_Sur_PIB'], label='Impact sur le PIB (%)', 
                linewidth=2, color='#0055A4', alpha=0.8)
         
         ax.set_title('Impact sur le PIB et la Productivité', fontsize=12, fontweight='bold')
@@ -654,7 +544,7 @@ class CETAImpactAnalyzer:
         
         # Gains de productivité en second axe
         ax2 = ax.twinx()
-        ax2.plot(df['Annee'], df['Gains_Productivite'], label='Gains de productivité (%)', 
+        ax2.plot(data['Annee'], data['Gains_Productivite'], label='Gains de productivité (%)', 
                 linewidth=2, color='#009900', alpha=0.8)
         ax2.set_ylabel('Gains productivité (%)', color='#009900')
         ax2.tick_params(axis='y', labelcolor='#009900')
@@ -664,26 +554,33 @@ class CETAImpactAnalyzer:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
     
-    def _plot_sectoral_analysis(self, df, ax):
+    def _plot_sectoral_analysis(self, data, ax):
         """Plot de l'analyse sectorielle"""
         # Sélectionner les indicateurs sectoriels disponibles
-        sector_columns = [col for col in df.columns if col.startswith('Exportations_') and col != 'Exportations_Vers_Canada']
+        sector_columns = [col for col in data if col.startswith('Exportations_') and col != 'Exportations_Vers_Canada']
         
-        colors = ['#0055A4', '#FF0000', '#FFCC00', '#009900', '#660099']
+        colors = self.COLORS[:5]
         
-        for i, column in enumerate(sector_columns[:5]):  # Limiter à 5 secteurs
-            sector_name = column.replace('Exportations_', '')
-            ax.plot(df['Annee'], df[column], label=sector_name, 
-                   linewidth=2, color=colors[i % len(colors)], alpha=0.8)
+        # Toutes les séries dans un seul artiste (limité à 5 secteurs)
+        sector_columns = sector_columns[:5]
+        segments = [np.column_stack([data['Annee'], data[column]]) for column in sector_columns]
+        line_colors = [colors[i % len(colors)] for i in range(len(segments))]
+        if segments:
+            ax.add_collection(LineCollection(segments, colors=line_colors, linewidths=2, alpha=0.8,
+                                             rasterized=True))
+            ax.autoscale_view()
         
         ax.set_title('Analyse Sectorielle - Exportations (M€)', fontsize=12, fontweight='bold')
         ax.set_ylabel('Valeur (M€)')
-        ax.legend()
+        if segments:
+            ax.legend(handles=[Line2D([], [], color=color, linewidth=2, alpha=0.8,
+                                      label=column.replace('Exportations_', ''))
+                               for color, column in zip(line_colors, sector_columns)])
         ax.grid(True, alpha=0.3)
     
-    def _plot_economic_gains(self, df, ax):
+    def _plot_economic_gains(self, data, ax):
         """Plot des gains économiques"""
-        ax.plot(df['Annee'], df['Economies_Douanieres'], label='Économies douanières (M€)', 
+        ax.plot(data['Annee'], data['Economies_Douanieres'], label='Économies douanières (M€)', 
                linewidth=2, color='#0055A4', alpha=0.8)
         
         ax.set_title('Gains Économiques du CETA', fontsize=12, fontweight='bold')
@@ -693,7 +590,7 @@ class CETAImpactAnalyzer:
         
         # Croissance sectorielle en second axe
         ax2 = ax.twinx()
-        ax2.plot(df['Annee'], df['Croissance_Sectorielle'], label='Croissance sectorielle (%)', 
+        ax2.plot(data['Annee'], data['Croissance_Sectorielle'], label='Croissance sectorielle (%)', 
                 linewidth=2, color='#FF6600', alpha=0.8)
         ax2.set_ylabel('Croissance sectorielle (%)', color='#FF6600')
         ax2.tick_params(axis='y', labelcolor='#FF6600')
@@ -705,17 +602,16 @@ class CETAImpactAnalyzer:
     
     def _plot_before_after_comparison(self, df, ax):
         """Plot de comparaison avant/après CETA"""
-        # Calculer les moyennes avant et après CETA
-        before_ceta = df[df['Annee'] < 2017].mean()
-        after_ceta = df[df['Annee'] >= 2017].mean()
-        
         # Sélectionner les indicateurs à comparer
         indicators = ['Exportations_Vers_Canada', 'Importations_Du_Canada', 
                      'Creation_Emplois', 'Investissements_Etrangers']
         labels = ['Exportations', 'Importations', 'Emplois créés', 'Investissements']
         
-        before_values = [before_ceta[ind] for ind in indicators]
-        after_values = [after_ceta[ind] for ind in indicators]
+        # Calculer les moyennes avant et après CETA en une seule agrégation
+        # (une période sans données donne des moyennes NaN)
+        means = df.groupby(df['Annee'] >= 2017)[indicators].mean().reindex([False, True])
+        before_values = means.loc[False].to_numpy()
+        after_values = means.loc[True].to_numpy()
         
         x = np.arange(len(indicators))
         width = 0.35
@@ -732,110 +628,182 @@ class CETAImpactAnalyzer:
     
     def _generate_ceta_insights(self, df):
         """Génère des insights analytiques sur le CETA"""
-        print(f"🇪🇺🇨🇦 INSIGHTS ANALYTIQUES - Accord CETA - {self.country_sector}")
-        print("=" * 70)
+        # Le rapport ne dépend que des données et de la période : il est mis en cache
+        # sous une empreinte BLAKE2b du contenu du DataFrame
+        digest = hashlib.blake2b(df.to_numpy().tobytes(), digest_size=16)
+        digest.update("\0".join(df.columns).encode())
+        key = (self.start_year, self.end_year, digest.digest())
+        
+        cache = self._report_cache
+        report = cache.get(key)
+        if report is None:
+            report = cache[key] = self._build_report_text(df)
+            if len(cache) > _REPORT_CACHE_SIZE:
+                cache.popitem(last=False)  # Évincer le rapport utilisé le moins récemment
+        else:
+            cache.move_to_end(key)
+        sys.stdout.write(report)
+    
+    def _build_report_text(self, df):
+        """Construit le texte complet des insights analytiques sur le CETA"""
+        cfg = self.config
+        ctype = cfg["type"]
+        # Les recommandations par secteur ne concernent que les pays de l'UE et l'union
+        secteurs = frozenset(cfg.get("secteurs_cles", ()) if ctype in ["pays_ue", "union"] else ())
+        
+        # Réductions NumPy en un seul passage sur un tableau 2D contigu de toutes les colonnes utiles
+        is_country = ctype != "secteur"
+        columns = ['Exportations_Vers_Canada', 'Importations_Du_Canada',
+                   'Droits_Douane_Moyens', 'Barrieres_Non_Tarifaires',
+                   'Balance_Commerciale', 'Creation_Emplois']
+        if is_country:
+            columns += ['Impact_Sur_PIB', 'Economies_Douanieres']
+        col = {column: j for j, column in enumerate(columns)}
+        
+        first, last, means, sums = _summarize(df[columns].to_numpy(dtype=np.float64))
+        # Une valeur initiale nulle donne NaN plutôt qu'une division par zéro
+        # (calculs en place : croissance et réduction sont opposées)
+        growth = np.divide(last, first, out=np.full_like(first, np.nan), where=first != 0)
+        growth -= 1
+        growth *= 100
+        reduction = 0.0 - growth  # et non -growth, qui afficherait -0.0% pour une croissance nulle
+        
+        lines = [f"🇪🇺🇨🇦 INSIGHTS ANALYTIQUES - Accord CETA - {self.country_sector}",
+                 "=" * 70]
         
         # 1. Statistiques de base
-        print("\n1. 📈 IMPACT COMMERCIAL:")
-        export_growth = ((df['Exportations_Vers_Canada'].iloc[-1] / 
-                         df['Exportations_Vers_Canada'].iloc[0]) - 1) * 100
-        import_growth = ((df['Importations_Du_Canada'].iloc[-1] / 
-                         df['Importations_Du_Canada'].iloc[0]) - 1) * 100
-        avg_trade_balance = df['Balance_Commerciale'].mean()
+        export_growth = growth[col['Exportations_Vers_Canada']]
+        import_growth = growth[col['Importations_Du_Canada']]
+        avg_trade_balance = means[col['Balance_Commerciale']]
         
-        print(f"Croissance des exportations ({self.start_year}-{self.end_year}): {export_growth:.1f}%")
-        print(f"Croissance des importations ({self.start_year}-{self.end_year}): {import_growth:.1f}%")
-        print(f"Balance commerciale moyenne: {avg_trade_balance:.0f} M€")
+        lines += ["\n1. 📈 IMPACT COMMERCIAL:",
+                  f"Croissance des exportations ({self.start_year}-{self.end_year}): " + _PCT1(export_growth),
+                  f"Croissance des importations ({self.start_year}-{self.end_year}): " + _PCT1(import_growth),
+                  "Balance commerciale moyenne: " + _M0(avg_trade_balance)]
         
         # 2. Impact économique
-        print("\n2. 📊 IMPACT ÉCONOMIQUE:")
-        total_jobs = df['Creation_Emplois'].sum()
+        total_jobs = sums[col['Creation_Emplois']]
         
-        print(f"Emplois créés au total: {total_jobs:.0f}")
+        lines += ["\n2. 📊 IMPACT ÉCONOMIQUE:",
+                  "Emplois créés au total: " + _N0(total_jobs)]
         
         # Ajouter les indicateurs spécifiques aux pays
-        if self.config["type"] != "secteur":
-            avg_gdp_impact = df['Impact_Sur_PIB'].mean() * 100
-            total_savings = df['Economies_Douanieres'].sum()
-            print(f"Impact moyen sur le PIB: {avg_gdp_impact:.3f}%")
-            print(f"Économies douanières totales: {total_savings:.0f} M€")
+        if is_country:
+            avg_gdp_impact = means[col['Impact_Sur_PIB']] * 100
+            total_savings = sums[col['Economies_Douanieres']]
+            lines.append("Impact moyen sur le PIB: " + _PCT3(avg_gdp_impact))
+            lines.append("Économies douanières totales: " + _M0(total_savings))
         
         # 3. Réduction des barrières
-        print("\n3. 📋 RÉDUCTION DES BARRIÈRES:")
-        tariff_reduction = ((df['Droits_Douane_Moyens'].iloc[0] - 
-                           df['Droits_Douane_Moyens'].iloc[-1]) / 
-                           df['Droits_Douane_Moyens'].iloc[0]) * 100
-        ntb_reduction = ((df['Barrieres_Non_Tarifaires'].iloc[0] - 
-                         df['Barrieres_Non_Tarifaires'].iloc[-1]) / 
-                         df['Barrieres_Non_Tarifaires'].iloc[0]) * 100
+        tariff_reduction = reduction[col['Droits_Douane_Moyens']]
+        ntb_reduction = reduction[col['Barrieres_Non_Tarifaires']]
         
-        print(f"Réduction des droits de douane: {tariff_reduction:.1f}%")
-        print(f"Réduction des barrières non tarifaires: {ntb_reduction:.1f}%")
+        lines += ["\n3. 📋 RÉDUCTION DES BARRIÈRES:",
+                  "Réduction des droits de douane: " + _PCT1(tariff_reduction),
+                  "Réduction des barrières non tarifaires: " + _PCT1(ntb_reduction)]
         
         # 4. Spécificités du pays/secteur
-        print(f"\n4. 🌟 SPÉCIFICITÉS DE {self.country_sector.upper()}:")
-        print(f"Type: {self.config['type']}")
-        if self.config["type"] in ["pays_ue", "union"]:
-            print(f"Secteurs clés: {', '.join(self.config['secteurs_cles'])}")
-        elif self.config["type"] == "secteur":
-            print(f"Pays clés: {', '.join(self.config['pays_cles'])}")
+        lines += [f"\n4. 🌟 SPÉCIFICITÉS DE {self.country_sector.upper()}:",
+                  f"Type: {ctype}"]
+        if ctype in ["pays_ue", "union"]:
+            lines.append(f"Secteurs clés: {', '.join(cfg['secteurs_cles'])}")
+        elif ctype == "secteur":
+            lines.append(f"Pays clés: {', '.join(cfg['pays_cles'])}")
         
         # 5. Événements marquants
-        print("\n5. 📅 ÉVÉNEMENTS MARQUANTS:")
-        print("• 2017: Entrée en vigueur provisoire du CETA")
-        print("• 2017-2019: Augmentation progressive des échanges")
-        print("• 2020: Impact de la pandémie COVID-19")
-        print("• 2021-2022: Reprise post-COVID et ratification complète")
-        print("• 2023-2027: Plein effet de l'accord et maturation des bénéfices")
+        lines += ["\n5. 📅 ÉVÉNEMENTS MARQUANTS:",
+                  "• 2017: Entrée en vigueur provisoire du CETA",
+                  "• 2017-2019: Augmentation progressive des échanges",
+                  "• 2020: Impact de la pandémie COVID-19",
+                  "• 2021-2022: Reprise post-COVID et ratification complète",
+                  "• 2023-2027: Plein effet de l'accord et maturation des bénéfices"]
         
         # 6. Recommandations stratégiques
-        print("\n6. 💡 RECOMMANDATIONS STRATÉGIQUES:")
-        if self.config["type"] in ["pays_ue", "union"]:
-            print("• Maximiser les opportunités d'exportation dans les secteurs clés")
-            print("• Adapter les normes et standards pour faciliter les échanges")
-            print("• Renforcer la coopération réglementaire avec le Canada")
-            print("• Développer des stratégies sectorielles ciblées")
-        elif self.config["type"] == "secteur":
-            print("• Identifier les niches de spécialisation dans la chaîne de valeur")
-            print("• Développer des partenariats industriels transatlantiques")
-            print("• Adapter les produits aux spécificités du marché canadien")
-            print("• Profiter des reconnaissances mutuelles de qualifications")
-        
-        # Recommandations spécifiques selon les secteurs
-        if self.config["type"] in ["pays_ue", "union"] and "vin" in self.config.get("secteurs_cles", []):
-            print("• Profiter de la protection des indications géographiques")
-            print("• Développer le marketing des vins européens au Canada")
-        if self.config["type"] in ["pays_ue", "union"] and "fromage" in self.config.get("secteurs_cles", []):
-            print("• Utiliser les quotas d'importation pour fromages fins")
-            print("• Mettre en valeur les appellations d'origine protégée")
-        if self.config["type"] in ["pays_ue", "union"] and "automobile" in self.config.get("secteurs_cles", []):
-            print("• Profiter de l'élimination des droits de douane")
-            print("• Harmoniser les standards techniques pour réduire les coûts")
-        if self.config["type"] in ["pays_ue", "union"] and "services" in self.config.get("secteurs_cles", []):
-            print("• Explorer les opportunités dans les services financiers")
-            print("• Développer les services professionnels et techniques")
+        lines += ["\n6. 💡 RECOMMANDATIONS STRATÉGIQUES:"]
+        if ctype in ["pays_ue", "union"]:
+            lines += ["• Maximiser les opportunités d'exportation dans les secteurs clés",
+                      "• Adapter les normes et standards pour faciliter les échanges",
+                      "• Renforcer la coopération réglementaire avec le Canada",
+                      "• Développer des stratégies sectorielles ciblées"]
+        elif ctype == "secteur":
+            lines += ["• Identifier les niches de spécialisation dans la chaîne de valeur",
+                      "• Développer des partenariats industriels transatlantiques",
+                      "• Adapter les produits aux spécificités du marché canadien",
+                      "• Profiter des reconnaissances mutuelles de qualifications"]
+        
+        # Recommandations spécifiques selon les secteurs (dans l'ordre de la table)
+        for secteur, recommandations in _RECOMMANDATIONS_SECTEURS.items():
+            if secteur in secteurs:
+                lines += recommandations
+        
+        return "\n".join(lines) + "\n"
+
+# Liste des pays et secteurs à analyser
+OPTIONS = (
+    "France", "Allemagne", "Italie", "Espagne", "Pays-Bas",
+    "Canada", "UE-27", "Agriculture", "Automobile", "Services"
+)
+
+def _save_csv(df, output_file):
+    """Sauvegarde un DataFrame en CSV, avec l'écrivain colonne par colonne de PyArrow s'il est installé"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(output_file, index=False)
+        return
+    
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_file)
+
+def _load_or_generate(analyzer, force=False):
+    """Relit le CSV d'une exécution précédente s'il existe, sinon génère et sauvegarde les données"""
+    output_file = f'{analyzer.country_sector}_ceta_data_{analyzer.start_year}_{analyzer.end_year}.csv'
+    if os.path.exists(output_file) and not force:
+        print(f"🔁 Réutilisation des données existantes: {output_file}")
+        return pd.read_csv(output_file)
+    
+    ceta_data = analyzer.generate_ceta_data()
+    _save_csv(ceta_data, output_file)
+    print(f"💾 Données sauvegardées: {output_file}")
+    return ceta_data
 
-def main():
+def _run_one(option, force=False):
+    """Analyse complète d'une option sans affichage interactif (exécutée dans un processus séparé)"""
+    analyzer = CETAImpactAnalyzer(option)
+    ceta_data = _load_or_generate(analyzer, force)
+    analyzer.create_ceta_analysis(ceta_data, show=False)
+    return option
+
+def main(argv=None):
     """Fonction principale pour l'analyse de l'impact du CETA"""
-    # Liste des pays et secteurs à analyser
-    options = [
-        "France", "Allemagne", "Italie", "Espagne", "Pays-Bas",
-        "Canada", "UE-27", "Agriculture", "Automobile", "Services"
-    ]
+    parser = argparse.ArgumentParser(description="Analyse de l'impact de l'accord CETA UE-Canada")
+    parser.add_argument('--all', action='store_true',
+                        help="analyser toutes les options en parallèle, sans affichage des graphiques")
+    parser.add_argument('--force', action='store_true',
+                        help="régénérer les données même si le CSV d'une exécution précédente existe")
+    # argv=None (appel depuis un notebook ou un script) : ne pas lire sys.argv
+    args = parser.parse_args([] if argv is None else argv)
     
     print("🇪🇺🇨🇦 ANALYSE DE L'IMPACT DE L'ACCORD CETA UE-CANADA (2017-2027)")
     print("=" * 70)
     
+    # Analyser toutes les options en parallèle (aucun état partagé entre elles)
+    if args.all:
+        with ProcessPoolExecutor() as executor:
+            for option in executor.map(partial(_run_one, force=args.force), OPTIONS):
+                print(f"✅ Analyse CETA pour {option} terminée!")
+        return
+    
     # Demander à l'utilisateur de choisir un pays/secteur
     print("Options disponibles:")
-    for i, option in enumerate(options, 1):
+    for i, option in enumerate(OPTIONS, 1):
         print(f"{i}. {option}")
     
     try:
         choix = int(input("\nChoisissez le numéro du pays/secteur à analyser: "))
-        if choix < 1 or choix > len(options):
-            raise ValueError
-        option_selectionnee = options[choix-1]
+        if choix < 1:  # Un indice négatif serait accepté silencieusement
+            raise IndexError
+        option_selectionnee = OPTIONS[choix-1]
     except (ValueError, IndexError):
         print("Choix invalide. Sélection de la France par défaut.")
         option_selectionnee = "France"
@@ -843,18 +811,14 @@ def main():
     # Initialiser l'analyseur
     analyzer = CETAImpactAnalyzer(option_selectionnee)
     
-    # Générer les données
-    ceta_data = analyzer.generate_ceta_data()
-    
-    # Sauvegarder les données
-    output_file = f'{option_selectionnee}_ceta_data_2017_2027.csv'
-    ceta_data.to_csv(output_file, index=False)
-    print(f"💾 Données sauvegardées: {output_file}")
+    # Générer et sauvegarder les données (ou relire celles d'une exécution précédente)
+    ceta_data = _load_or_generate(analyzer, args.force)
     
     # Aperçu des données
     print("\n👀 Aperçu des données:")
-    print(ceta_data[['Annee', 'Exportations_Vers_Canada', 'Importations_Du_Canada', 
-                    'Balance_Commerciale', 'Creation_Emplois']].head())
+    preview = ceta_data.iloc[:5][['Annee', 'Exportations_Vers_Canada', 'Importations_Du_Canada', 
+                                  'Balance_Commerciale', 'Creation_Emplois']]
+    print(preview.to_string(index=False, float_format='{:.2f}'.format))
     
     # Créer l'analyse
     print("\n📈 Création de l'analyse CETA...")
@@ -865,4 +829,4 @@ def main():
     print("📦 Données: Échanges commerciaux, emploi, investissements, impacts économiques")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
\ No newline at end of file